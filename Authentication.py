@@ -4,11 +4,15 @@ APIキーやエンドポイント、APIバージョン、モデルのデプロ
 """
 
 import os
+from functools import cache
 from openai import AzureOpenAI
 from dotenv import load_dotenv
 
 # .envファイルから環境変数を読み込む
-load_dotenv()
+# 親プロセスで読み込み済みの場合は引き継いだ環境変数を使い、.envを読み直さない
+if "_AUTH_DOTENV_LOADED" not in os.environ:
+    load_dotenv()
+    os.environ["_AUTH_DOTENV_LOADED"] = "1"
 
 # 認証情報の読み込み
 AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
@@ -17,10 +21,15 @@ API_VERSION = os.getenv("API_VERSION")
 DEPLOYMENT_ID_FOR_CHAT_COMPLETION = os.getenv("DEPLOYMENT_ID_FOR_CHAT_COMPLETION")
 DEPLOYMENT_ID_FOR_EMBEDDING = os.getenv("DEPLOYMENT_ID_FOR_EMBEDDING")
 
-# AzureOpenAI のクライアントを初期化(Azure上のGPTや埋め込みモデルへのアクセスの設定)
-client = AzureOpenAI(
-    api_key=AZURE_OPENAI_API_KEY,
-    azure_endpoint=AZURE_OPENAI_ENDPOINT,
-    api_version=API_VERSION
-)
 
+@cache
+def get_client() -> AzureOpenAI:
+    """
+    AzureOpenAI のクライアントを初期化(Azure上のGPTや埋め込みモデルへのアクセスの設定)
+    初回呼び出し時に生成し、以降はプロセス内で同じインスタンスを使い回す。
+    """
+    return AzureOpenAI(
+        api_key=AZURE_OPENAI_API_KEY,
+        azure_endpoint=AZURE_OPENAI_ENDPOINT,
+        api_version=API_VERSION
+    )